@@ -1,6 +1,211 @@
+import functools
 import networkx as nx
+import numpy as np
 import random
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from scipy import sparse
+
+try:
+    import igraph as ig
+except ImportError:
+    # Dependência opcional: só é necessária para as variantes *_ig
+    ig = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Decorador neutro: sem numba os núcleos rodam como Python puro
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def _wrap(func):
+            return func
+        return _wrap
+
+try:
+    from numba import cuda
+    from numba.cuda.random import (create_xoroshiro128p_states,
+                                   xoroshiro128p_uniform_float32)
+except ImportError:
+    # Dependência opcional: só é necessária para RWEB_batch (GPU)
+    cuda = None
+
+
+def _check_checkpoints(checkpoint_sizes):
+    """
+    Valida checkpoint_sizes e o converte para np.int64, sem mutar a lista
+    do chamador.
+
+    As docstrings sempre exigiram ordem crescente; o sort() in-place feito
+    a cada chamada mascarava entradas fora de ordem e alterava o estado do
+    chamador. A exigência agora é verificada em uma passada vetorizada.
+    """
+    cps = np.asarray(checkpoint_sizes, dtype=np.int64)
+    if len(cps) > 1 and not (np.diff(cps) >= 0).all():
+        raise ValueError("checkpoint_sizes deve estar em ordem crescente")
+    return cps
+
+
+def _as_int_graph(G):
+    """
+    Garante um grafo com rótulos inteiros 0..N-1 na ordem de inserção.
+
+    O relabel duplica o grafo inteiro (O(N+E) em alocações de dicts), mas
+    na prática os chamadores frequentemente já passam grafos gerados com
+    rótulos 0..N-1; nesse caso a verificação O(N) abaixo basta e o próprio
+    G é devolvido — seguro, porque nenhum amostrador muta o grafo: toda
+    remoção de aresta acontece na cópia CSR.
+    """
+    for i, v in enumerate(G):
+        if v is not i and v != i:
+            return nx.convert_node_labels_to_integers(
+                G, first_label=0, ordering='default', label_attribute=None)
+    return G
+
+
+def _to_csr(G):
+    """
+    Converte um grafo NetworkX (com rótulos inteiros 0..N-1) para a
+    representação CSR usada nos loops internos dos amostradores.
+
+    Retorna:
+        indptr (np.int64[N+1]): início da lista de vizinhos de cada nó.
+        indices (np.int32[2E]): vizinhos concatenados (cópia gravável).
+        active_len (np.int64[N]): número de vizinhos ainda "ativos" de cada
+                                  nó. Permite remover arestas por
+                                  swap-com-o-último sem reconstruir o CSR.
+    """
+    if G.number_of_nodes() == 0:
+        # to_scipy_sparse_array rejeita grafos vazios
+        return (np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.int64))
+    # dtype=np.int8 encolhe o array de pesos (descartado: só indptr e
+    # indices interessam) para 1 byte por slot, como no CSR do RWEB_ig
+    A = nx.to_scipy_sparse_array(G, format='csr', dtype=np.int8)
+    indptr = A.indptr.astype(np.int64)
+    # Cópia gravável: a remoção de arestas compacta os slots in-place
+    indices = A.indices.astype(np.int32)
+    active_len = (indptr[1:] - indptr[:-1]).astype(np.int64)
+    return indptr, indices, active_len
+
+
+def _csr_twin(indptr, indices):
+    """
+    Calcula, para cada slot j do CSR (aresta direcionada u -> v), o slot da
+    aresta reversa v -> u.
+
+    Como o CSR de um grafo não direcionado é simétrico, ordenar os slots
+    por (vizinho, origem) produz exatamente a permutação que leva cada slot
+    ao seu gêmeo — tudo vetorizado, sem loop Python.
+    """
+    num_nodes = len(indptr) - 1
+    src = np.repeat(np.arange(num_nodes, dtype=np.int32), np.diff(indptr))
+    return np.lexsort((src, indices)).astype(np.int64)
+
+
+@njit(cache=True, nogil=True)
+def _csr_remove_edge(indptr, indices, active_len, u, v, j):
+    """
+    Remove a aresta (u, v) do CSR, onde j é o slot de v na linha de u.
+
+    A remoção troca o slot escolhido com o último slot ativo da linha e
+    decrementa active_len (swap-com-o-último). O slot de u na linha de v é
+    localizado por varredura linear — curta em grafos esparsos.
+    """
+    last = indptr[u] + active_len[u] - 1
+    indices[j] = indices[last]
+    indices[last] = v
+    active_len[u] -= 1
+
+    start_v = indptr[v]
+    for t in range(start_v, start_v + active_len[v]):
+        if indices[t] == u:
+            last_v = start_v + active_len[v] - 1
+            indices[t] = indices[last_v]
+            indices[last_v] = u
+            active_len[v] -= 1
+            break
+
+
+@njit(cache=True, nogil=True)
+def _rweb_walk(indptr, indices, active_len, max_n, checkpoint_sizes, seed):
+    """
+    Núcleo compilado (numba) da caminhada do RWEB sobre o CSR.
+
+    Retorna o nó inicial, os pares (u, v) das arestas amostradas na ordem
+    de inserção e, para cada checkpoint, o número de arestas amostradas no
+    momento em que ele foi atingido (-1 se não foi atingido).
+    """
+    np.random.seed(seed)
+    num_nodes = indptr.shape[0] - 1
+
+    # Laços (diagonal) ocupam UM slot no CSR, não dois; o total de arestas
+    # consumíveis é (slots + laços) / 2 — dimensionar por slots // 2
+    # estouraria os buffers em grafos com laços
+    n_loops = 0
+    for u in range(num_nodes):
+        for t in range(indptr[u], indptr[u + 1]):
+            if indices[t] == u:
+                n_loops += 1
+    max_edges = (indices.shape[0] + n_loops) // 2
+
+    # Pilha pré-alocada: cada push consome uma aresta, logo cabe em E+1
+    stack = np.empty(max_edges + 1, dtype=np.int32)
+    start_node = np.random.randint(num_nodes)
+    stack[0] = start_node
+    sp = 1
+
+    # Bitmap de nós já presentes na amostra — teste O(1), sem hashing
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    visited[start_node] = 1
+    n_sampled = 1
+
+    edges_u = np.empty(max_edges, dtype=np.int32)
+    edges_v = np.empty(max_edges, dtype=np.int32)
+    n_edges = 0
+
+    n_checkpoints = checkpoint_sizes.shape[0]
+    checkpoint_cuts = np.full(n_checkpoints, -1, dtype=np.int64)
+    cp_idx = 0
+    # O nó inicial sozinho já pode atender os primeiros checkpoints
+    while cp_idx < n_checkpoints and n_sampled >= checkpoint_sizes[cp_idx]:
+        checkpoint_cuts[cp_idx] = n_edges
+        cp_idx += 1
+
+    while n_sampled < max_n and sp > 0:
+        current_node = stack[sp - 1]
+        degree = active_len[current_node]
+
+        if degree > 0:
+            j = indptr[current_node] + np.random.randint(degree)
+            next_node = indices[j]
+
+            _csr_remove_edge(indptr, indices, active_len,
+                             current_node, next_node, j)
+
+            node_added = visited[next_node] == 0
+            if node_added:
+                visited[next_node] = 1
+                n_sampled += 1
+
+            edges_u[n_edges] = current_node
+            edges_v[n_edges] = next_node
+            n_edges += 1
+
+            stack[sp] = next_node
+            sp += 1
+
+            if node_added:
+                while cp_idx < n_checkpoints and \
+                      n_sampled >= checkpoint_sizes[cp_idx]:
+                    checkpoint_cuts[cp_idx] = n_edges
+                    cp_idx += 1
+        else:
+            # Sem vizinhos disponíveis: backtracking (desempilha)
+            sp -= 1
+
+    return start_node, edges_u[:n_edges], edges_v[:n_edges], checkpoint_cuts
 
 
 def RWEB(G, max_n, checkpoint_sizes):
@@ -23,85 +228,556 @@ def RWEB(G, max_n, checkpoint_sizes):
               no momento em que seu número de nós atingiu um checkpoint.
               A ordem dos grafos na lista corresponde à ordem de checkpoint_sizes.
     """
-    # Sempre trabalha com uma cópia, pois as arestas serão removidas
-    G_copy = nx.convert_node_labels_to_integers(G.copy(), 0, 'default', True)
-    sampled_graph = nx.Graph()
+    # _as_int_graph só relabela (duplicando o grafo) se for preciso; a
+    # caminhada só remove arestas da cópia CSR dos índices e o grafo
+    # original nunca é modificado
+    G_copy = _as_int_graph(G)
+    indptr, indices, active_len = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
 
-    nodes = list(G_copy.nodes())
-    if not nodes:
+    if num_nodes == 0:
         # Se não há nós no grafo original, retorna grafos vazios para os checkpoints
-        return [sampled_graph] * len(checkpoint_sizes)
+        return [nx.Graph()] * len(checkpoint_sizes)
+
+    start_node, edges_u, edges_v, checkpoint_cuts = RWEB_fast(
+        indptr, indices, active_len, max_n, checkpoint_sizes)
+
+    return _rweb_build_checkpoints(start_node, edges_u, edges_v,
+                                   checkpoint_cuts)
+
+
+def RWEB_fast(indptr, indices, active_len, max_n, checkpoint_sizes,
+              seed=None):
+    """
+    Caminho rápido do RWEB para chamadores que já têm o grafo em CSR:
+    arrays entram, arrays saem — nenhuma chamada NetworkX.
+
+    ATENÇÃO: a caminhada consome arestas in-place em indices/active_len;
+    passe cópias se o CSR for reutilizado.
+
+    Parâmetros:
+        indptr, indices, active_len: CSR como o devolvido por _to_csr.
+        max_n (int): como em RWEB.
+        checkpoint_sizes (list): como em RWEB (ordem crescente).
+        seed (int, opcional): semente do núcleo compilado; sorteada de
+                              random quando omitida.
+
+    Retorna:
+        tuple: (start_node, edges_u, edges_v, checkpoint_cuts) — nó
+               inicial, arestas amostradas em ordem (int32) e, por
+               checkpoint, o corte na lista de arestas (-1 = não
+               atingido). _rweb_build_checkpoints materializa grafos
+               NetworkX a partir disso, se necessário.
+    """
+    # Os checkpoints devem chegar em ordem crescente (contrato da docstring)
+    cps = _check_checkpoints(checkpoint_sizes)
+    if seed is None:
+        seed = random.randrange(2**31 - 1)
+    return _rweb_walk(indptr, indices, active_len, max_n, cps, seed)
+
+
+def _rweb_build_checkpoints(start_node, edges_u, edges_v, checkpoint_cuts):
+    """
+    Reconstrói o grafo amostrado de cada checkpoint fatiando a lista de
+    arestas até o corte registrado durante a caminhada. Checkpoints não
+    atingidos (-1) recebem o grafo amostrado final.
+    """
+    checkpoint_graphs = []
+    for cut in checkpoint_cuts:
+        if cut < 0:
+            cut = len(edges_u)
+        g = nx.Graph()
+        g.add_node(int(start_node))
+        g.add_edges_from(zip(edges_u[:cut].tolist(), edges_v[:cut].tolist()))
+        checkpoint_graphs.append(g)
+
+    return checkpoint_graphs
+
+
+def RWEB_ig(G_ig, max_n, checkpoint_sizes):
+    """
+    Variante do RWEB que aceita um igraph.Graph (dependência opcional).
+
+    Em grafos grandes o igraph mantém a topologia em C com uma fração da
+    memória do dicionário-de-dicionários do NetworkX; aqui a lista de
+    arestas é lida direto para o CSR, sem materializar um networkx.Graph
+    intermediário, e a caminhada usa o mesmo núcleo compilado do RWEB.
+
+    Parâmetros:
+        G_ig (igraph.Graph): grafo original (não direcionado).
+        max_n (int): número MÁXIMO de nós que o subgrafo amostrado deve atingir.
+        checkpoint_sizes (list): como em RWEB.
+
+    Retorna:
+        list: como em RWEB — um networkx.Graph por checkpoint.
+    """
+    if ig is None:
+        raise ImportError("RWEB_ig requer o pacote opcional python-igraph")
+
+    num_nodes = G_ig.vcount()
+    if num_nodes == 0:
+        return [nx.Graph()] * len(checkpoint_sizes)
+
+    edges = np.asarray(G_ig.get_edgelist(), dtype=np.int32)
+    if len(edges):
+        # Monta o CSR simétrico direto da lista de arestas
+        data = np.ones(2 * len(edges), dtype=np.int8)
+        rows = np.concatenate([edges[:, 0], edges[:, 1]])
+        cols = np.concatenate([edges[:, 1], edges[:, 0]])
+        A = sparse.coo_matrix((data, (rows, cols)),
+                              shape=(num_nodes, num_nodes)).tocsr()
+        indptr = A.indptr.astype(np.int64)
+        indices = A.indices.astype(np.int32)
+    else:
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        indices = np.zeros(0, dtype=np.int32)
+    active_len = (indptr[1:] - indptr[:-1]).astype(np.int64)
+
+    start_node, edges_u, edges_v, checkpoint_cuts = RWEB_fast(
+        indptr, indices, active_len, max_n, checkpoint_sizes)
+
+    return _rweb_build_checkpoints(start_node, edges_u, edges_v,
+                                   checkpoint_cuts)
+
+
+if cuda is not None:
+    @cuda.jit
+    def _rweb_batch_kernel(indptr, indices, twin, max_n, checkpoint_sizes,
+                           rng_states, used, visited, stack,
+                           out_start, out_u, out_v, out_len, out_cuts):
+        """
+        Um thread por caminhada RWEB independente sobre o CSR compartilhado.
+
+        O CSR fica em memória global e nunca é mutado: cada caminhada marca
+        os slots de aresta consumidos no seu próprio bitmap `used` (o gêmeo
+        da aresta reversa é marcado via `twin`). Semântica idêntica à de
+        _rweb_walk.
+        """
+        walk = cuda.grid(1)
+        if walk >= out_start.shape[0]:
+            return
+
+        num_nodes = indptr.shape[0] - 1
+
+        start_node = int(xoroshiro128p_uniform_float32(rng_states, walk)
+                         * num_nodes)
+        if start_node >= num_nodes:
+            start_node = num_nodes - 1
+        out_start[walk] = start_node
+
+        stack[walk, 0] = start_node
+        sp = 1
+        visited[walk, start_node] = 1
+        n_sampled = 1
+        n_edges = 0
+
+        n_checkpoints = checkpoint_sizes.shape[0]
+        cp_idx = 0
+        while cp_idx < n_checkpoints and \
+                n_sampled >= checkpoint_sizes[cp_idx]:
+            out_cuts[walk, cp_idx] = n_edges
+            cp_idx += 1
+
+        while n_sampled < max_n and sp > 0:
+            current_node = stack[walk, sp - 1]
+            row_start = indptr[current_node]
+            row_end = indptr[current_node + 1]
+
+            # Grau vivo: slots da linha ainda não consumidos pela caminhada
+            degree = 0
+            for slot in range(row_start, row_end):
+                if used[walk, slot] == 0:
+                    degree += 1
+
+            if degree == 0:
+                # Sem vizinhos disponíveis: backtracking (desempilha)
+                sp -= 1
+                continue
+
+            pick = int(xoroshiro128p_uniform_float32(rng_states, walk)
+                       * degree)
+            if pick >= degree:
+                pick = degree - 1
+            j = row_start
+            while True:
+                if used[walk, j] == 0:
+                    if pick == 0:
+                        break
+                    pick -= 1
+                j += 1
+
+            next_node = indices[j]
+            used[walk, j] = 1
+            used[walk, twin[j]] = 1
+
+            out_u[walk, n_edges] = current_node
+            out_v[walk, n_edges] = next_node
+            n_edges += 1
+
+            stack[walk, sp] = next_node
+            sp += 1
+
+            if visited[walk, next_node] == 0:
+                visited[walk, next_node] = 1
+                n_sampled += 1
+                while cp_idx < n_checkpoints and \
+                        n_sampled >= checkpoint_sizes[cp_idx]:
+                    out_cuts[walk, cp_idx] = n_edges
+                    cp_idx += 1
+
+        out_len[walk] = n_edges
+
+
+def RWEB_batch(G, max_n, checkpoint_sizes, n_walks, seed=None):
+    """
+    Executa n_walks caminhadas RWEB independentes em paralelo na GPU
+    (numba.cuda, dependência opcional) — um thread por caminhada.
+
+    O CSR do grafo é copiado para a GPU uma única vez e compartilhado por
+    todas as caminhadas; o estado mutável de cada uma (bitmap de arestas
+    consumidas, bitmap de nós visitados e pilha) fica em arrays por
+    caminhada na memória global, o que custa O(N + E) bytes por caminhada.
+    Cada thread sorteia com seu próprio estado xoroshiro128+.
+
+    Parâmetros:
+        G (networkx.Graph): grafo original.
+        max_n (int): como em RWEB.
+        checkpoint_sizes (list): como em RWEB.
+        n_walks (int): número de caminhadas independentes.
+        seed (int, opcional): semente dos estados PRNG da GPU.
+
+    Retorna:
+        list: uma lista por caminhada, cada uma no formato de retorno do
+              RWEB (um networkx.Graph por checkpoint).
+    """
+    if cuda is None or not cuda.is_available():
+        raise RuntimeError(
+            "RWEB_batch requer numba.cuda e uma GPU CUDA disponível")
+
+    G_copy = _as_int_graph(G)
+    indptr, indices, _ = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
+
+    if num_nodes == 0:
+        return [[nx.Graph()] * len(checkpoint_sizes)
+                for _ in range(n_walks)]
+
+    cps = _check_checkpoints(checkpoint_sizes)
+    twin = _csr_twin(indptr, indices)
+    # Laços ocupam um único slot no CSR; o total de arestas consumíveis é
+    # (slots + laços) / 2, como em _rweb_walk — slots // 2 subdimensionaria
+    # os buffers de saída e a pilha em grafos com laços
+    row_of = np.repeat(np.arange(num_nodes, dtype=np.int32),
+                       np.diff(indptr))
+    n_loops = int((row_of == indices).sum())
+    max_edges = max(1, (len(indices) + n_loops) // 2)
+
+    if seed is None:
+        seed = random.randrange(2**31 - 1)
+
+    d_indptr = cuda.to_device(indptr)
+    d_indices = cuda.to_device(indices)
+    d_twin = cuda.to_device(twin)
+    d_cps = cuda.to_device(cps)
+    d_used = cuda.to_device(
+        np.zeros((n_walks, max(1, len(indices))), dtype=np.uint8))
+    d_visited = cuda.to_device(
+        np.zeros((n_walks, num_nodes), dtype=np.uint8))
+    # Pilha: cada push consome uma aresta, logo cabe em E+1 (cf. _rweb_walk)
+    d_stack = cuda.device_array((n_walks, max_edges + 1), dtype=np.int32)
+    d_start = cuda.device_array(n_walks, dtype=np.int32)
+    d_u = cuda.device_array((n_walks, max_edges), dtype=np.int32)
+    d_v = cuda.device_array((n_walks, max_edges), dtype=np.int32)
+    d_len = cuda.device_array(n_walks, dtype=np.int64)
+    d_cuts = cuda.to_device(np.full((n_walks, len(cps)), -1, dtype=np.int64))
+
+    rng_states = create_xoroshiro128p_states(n_walks, seed=seed)
+    threads = 256
+    blocks = (n_walks + threads - 1) // threads
+    _rweb_batch_kernel[blocks, threads](
+        d_indptr, d_indices, d_twin, max_n, d_cps, rng_states,
+        d_used, d_visited, d_stack, d_start, d_u, d_v, d_len, d_cuts)
+
+    starts = d_start.copy_to_host()
+    all_u = d_u.copy_to_host()
+    all_v = d_v.copy_to_host()
+    lens = d_len.copy_to_host()
+    cuts = d_cuts.copy_to_host()
+
+    results = []
+    for w in range(n_walks):
+        n_e = int(lens[w])
+        results.append(_rweb_build_checkpoints(
+            starts[w], all_u[w, :n_e], all_v[w, :n_e], cuts[w]))
+    return results
+
+
+def CNARW(G, max_n, checkpoint_sizes):
+    """
+    Common Neighbour Aware Random Walk (CNARW) com checkpoints.
+
+    - Caminha como um random walk simples, mas pondera a escolha do próximo
+      salto por 1 / (1 + vizinhos comuns com o nó atual): candidatos com
+      poucos vizinhos comuns puxam a caminhada para regiões ainda não
+      exploradas, encurtando o burn-in em grafos de lei de potência.
+    - Não remove arestas; se o nó atual não tem vizinhos, ou a caminhada
+      fica presa em uma região já visitada, reinicia em um nó aleatório.
+
+    Parâmetros:
+        G (networkx.Graph): grafo original.
+        max_n (int): número MÁXIMO de nós que o subgrafo amostrado deve atingir.
+        checkpoint_sizes (list): como em RWEB.
 
-    # Inicializa pilha e primeiro nó aleatório
-    start_node = random.choice(nodes)
-    stack = [start_node]
-    sampled_graph.add_node(start_node) # Adiciona o nó inicial à amostra
+    Retorna:
+        list: como em RWEB — um networkx.Graph (nós visitados + arestas
+              percorridas) por checkpoint.
+    """
+    G_copy = _as_int_graph(G)
+    indptr, indices, _ = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
 
-    # Lista para armazenar os grafos nos checkpoints
-    checkpoint_graphs = [None] * len(checkpoint_sizes)
+    if num_nodes == 0:
+        return [nx.Graph()] * len(checkpoint_sizes)
+
+    cps = _check_checkpoints(checkpoint_sizes)
+
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    nodes_order = []
+    edges_list = []
+    seen_edges = set()
+    # Cache de vizinhos comuns por aresta — o custo da interseção é pago uma
+    # única vez mesmo que a caminhada reatravesse a aresta
+    cn_cache = {}
+
+    checkpoint_cuts = [None] * len(checkpoint_sizes)
     current_checkpoint_idx = 0
-    
-    # Garantir que os checkpoints estão em ordem crescente
-    checkpoint_sizes.sort()
 
-    # --- VERIFICAÇÃO DO PRIMEIRO CHECKPOINT (se start_node já atende) ---
+    current_node = random.randrange(num_nodes)
+    visited[current_node] = 1
+    nodes_order.append(current_node)
+    n_sampled = 1
+
     while current_checkpoint_idx < len(checkpoint_sizes) and \
-          sampled_graph.number_of_nodes() >= checkpoint_sizes[current_checkpoint_idx]:
-        
-        checkpoint_graphs[current_checkpoint_idx] = sampled_graph.copy() # Copia o estado atual
+          n_sampled >= cps[current_checkpoint_idx]:
+        checkpoint_cuts[current_checkpoint_idx] = (n_sampled, len(edges_list))
         current_checkpoint_idx += 1
 
+    # Passos seguidos sem nó novo; acima do limite, a caminhada está presa
+    # em uma região já visitada (ex.: componente exaurida) e é reiniciada
+    stale_steps = 0
+    stale_limit = 10 * num_nodes
+
+    # Ligações locais: poupam um LOAD_GLOBAL + LOAD_ATTR por passo
+    _choices = random.choices
+    _randrange = random.randrange
+
+    while n_sampled < max_n:
+        row = indices[indptr[current_node]:indptr[current_node + 1]]
 
-    # Loop principal da caminhada
-    # Continua enquanto não atingir max_n e a pilha não estiver vazia
-    while sampled_graph.number_of_nodes() < max_n and stack:
-        current_node = stack[-1] # Pega o nó no topo da pilha
-
-        # Encontra vizinhos do nó atual no grafo G_copy (que está sendo modificado)
-        neighbors = list(G_copy.neighbors(current_node))
-
-        if neighbors:
-            # Escolhe um vizinho aleatório
-            next_node = random.choice(neighbors)
-            
-            # Remove a aresta do grafo original G_copy (característica do RWEB)
-            G_copy.remove_edge(current_node, next_node)
-
-            # Adiciona o próximo nó e a aresta ao grafo amostrado
-            # Verifica se o nó já está na amostra para não contá-lo novamente no checkpoint
-            node_added_to_sample = False
-            if next_node not in sampled_graph:
-                sampled_graph.add_node(next_node)
-                node_added_to_sample = True # Indica que um novo nó foi adicionado à amostra real
-            
-            sampled_graph.add_edge(current_node, next_node)
-
-            # Empilha o próximo nó
-            stack.append(next_node)
-
-            # --- VERIFICAÇÃO DE CHECKPOINTS NO LOOP ---
-            # Se um novo nó foi adicionado à amostra, verifica se um checkpoint foi atingido
-            if node_added_to_sample:
-                while current_checkpoint_idx < len(checkpoint_sizes) and \
-                      sampled_graph.number_of_nodes() >= checkpoint_sizes[current_checkpoint_idx]:
-                    
-                    # Copia o estado atual da sampled_graph e armazena
-                    checkpoint_graphs[current_checkpoint_idx] = sampled_graph.copy()
-                    current_checkpoint_idx += 1
+        if len(row) == 0 or stale_steps > stale_limit:
+            # Reinicia em um nó ainda não visitado (se não houver, acabou)
+            unvisited = np.flatnonzero(visited == 0)
+            if len(unvisited) == 0:
+                break
+            current_node = int(unvisited[_randrange(len(unvisited))])
+            visited[current_node] = 1
+            nodes_order.append(current_node)
+            n_sampled += 1
+            stale_steps = 0
+
+            while current_checkpoint_idx < len(checkpoint_sizes) and \
+                  n_sampled >= cps[current_checkpoint_idx]:
+                checkpoint_cuts[current_checkpoint_idx] = (n_sampled,
+                                                           len(edges_list))
+                current_checkpoint_idx += 1
+            continue
+
+        # Pesos 1 / (1 + vizinhos comuns), via interseção das linhas CSR
+        # ordenadas — O(grau) amortizado por candidato, sem has_edge
+        row_list = row.tolist()
+        weights = []
+        for v in row_list:
+            key = (current_node << 32) | v \
+                if current_node < v else (v << 32) | current_node
+            common = cn_cache.get(key)
+            if common is None:
+                row_v = indices[indptr[v]:indptr[v + 1]]
+                common = np.intersect1d(row, row_v,
+                                        assume_unique=True).size
+                cn_cache[key] = common
+            weights.append(1.0 / (1.0 + common))
+
+        next_node = _choices(row_list, weights=weights)[0]
+
+        edge_key = (current_node << 32) | next_node \
+            if current_node < next_node else (next_node << 32) | current_node
+        if edge_key not in seen_edges:
+            seen_edges.add(edge_key)
+            edges_list.append((current_node, next_node))
+
+        if not visited[next_node]:
+            visited[next_node] = 1
+            nodes_order.append(next_node)
+            n_sampled += 1
+            stale_steps = 0
+
+            while current_checkpoint_idx < len(checkpoint_sizes) and \
+                  n_sampled >= cps[current_checkpoint_idx]:
+                checkpoint_cuts[current_checkpoint_idx] = (n_sampled,
+                                                           len(edges_list))
+                current_checkpoint_idx += 1
         else:
-            # Se não há vizinhos disponíveis no grafo G_copy, faz backtracking (desempilha)
-            stack.pop()
-    
-    # Preenche checkpoints não atingidos:
-    # Se a caminhada terminou antes de atingir todos os checkpoints ou max_n,
-    # os checkpoints restantes recebem uma cópia do grafo amostrado final
-    for i in range(len(checkpoint_sizes)):
-        if checkpoint_graphs[i] is None:
-            # Se a amostra final tem nós, usa-a. Caso contrário, usa um grafo vazio.
-            if sampled_graph.number_of_nodes() > 0:
-                checkpoint_graphs[i] = sampled_graph.copy()
-            else:
-                checkpoint_graphs[i] = nx.Graph() # Retorna grafo vazio se a amostra não cresceu
+            stale_steps += 1
+
+        current_node = next_node
+
+    # Materializa os grafos dos checkpoints a partir dos prefixos das listas
+    checkpoint_graphs = []
+    for cut in checkpoint_cuts:
+        if cut is None:
+            cut = (n_sampled, len(edges_list))
+        n_i, m_i = cut
+        g = nx.Graph()
+        g.add_nodes_from(nodes_order[:n_i])
+        g.add_edges_from(edges_list[:m_i])
+        checkpoint_graphs.append(g)
+
+    return checkpoint_graphs
+
+
+def FS(G, max_n, m, checkpoint_sizes):
+    """
+    Frontier Sampling (FS) com sorteios em lote e checkpoints.
+
+    - Mantém uma fronteira de m caminhadas simultâneas; a cada passo um
+      membro da fronteira é sorteado com probabilidade proporcional ao seu
+      grau, salta uniformemente para um vizinho e é substituído por ele.
+    - Os sorteios da fronteira são feitos em lotes via np.random.choice,
+      amortizando o overhead do interpretador entre os passos; os pesos por
+      grau são renormalizados apenas a cada lote.
+
+    Parâmetros:
+        G (networkx.Graph): grafo original.
+        max_n (int): número MÁXIMO de nós que o subgrafo amostrado deve atingir.
+        m (int): tamanho da fronteira (número de caminhadas simultâneas).
+        checkpoint_sizes (list): como em RWEB.
+
+    Retorna:
+        list: como em RWEB — um networkx.Graph (nós visitados + arestas
+              percorridas) por checkpoint.
+    """
+    G_copy = _as_int_graph(G)
+    indptr, indices, _ = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
+
+    if num_nodes == 0:
+        return [nx.Graph()] * len(checkpoint_sizes)
+
+    cps = _check_checkpoints(checkpoint_sizes)
+    deg = indptr[1:] - indptr[:-1]
+
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    nodes_order = []
+    edges_list = []
+    seen_edges = set()
+
+    checkpoint_cuts = [None] * len(checkpoint_sizes)
+    current_checkpoint_idx = 0
+    n_sampled = 0
+
+    def _advance_checkpoints():
+        nonlocal current_checkpoint_idx
+        while current_checkpoint_idx < len(checkpoint_sizes) and \
+              n_sampled >= cps[current_checkpoint_idx]:
+            checkpoint_cuts[current_checkpoint_idx] = (n_sampled,
+                                                       len(edges_list))
+            current_checkpoint_idx += 1
+
+    # Fronteira inicial: m nós distintos sorteados uniformemente; max_n é
+    # um teto rígido ("número MÁXIMO"), então a fronteira não pode nascer
+    # maior do que ele
+    m_eff = max(1, min(m, num_nodes, max_n))
+    frontier = np.random.choice(num_nodes, size=m_eff, replace=False)
+    for node in frontier.tolist():
+        visited[node] = 1
+        nodes_order.append(node)
+        n_sampled += 1
+        # Avança a cada nó para os cortes registrarem o n_sampled exato
+        _advance_checkpoints()
+
+    batch_size = 1024
+    # Passos seguidos sem nó novo; acima do limite a fronteira está presa em
+    # uma região exaurida e é reamostrada entre os nós ainda não visitados
+    stale_steps = 0
+    stale_limit = 10 * num_nodes
+
+    while n_sampled < max_n:
+        deg_f = deg[frontier].astype(np.float64)
+        total = deg_f.sum()
+
+        if total == 0.0 or stale_steps > stale_limit:
+            unvisited = np.flatnonzero(visited == 0)
+            if len(unvisited) == 0:
+                break
+            # Reamostragem também limitada pelo teto de max_n
+            take = min(m_eff, len(unvisited), max_n - n_sampled)
+            frontier = np.random.choice(unvisited, size=take, replace=False)
+            for node in frontier.tolist():
+                visited[node] = 1
+                nodes_order.append(node)
+                n_sampled += 1
+                _advance_checkpoints()
+            stale_steps = 0
+            continue
+
+        # Lote de sorteios: K índices da fronteira ponderados por grau e K
+        # uniformes para o salto — duas chamadas NumPy para 1024 passos
+        picks = np.random.choice(len(frontier), size=batch_size,
+                                 p=deg_f / total).tolist()
+        uniforms = np.random.random(batch_size).tolist()
+
+        progressed = False
+        for pick, uniform in zip(picks, uniforms):
+            if n_sampled >= max_n:
+                break
+
+            u = int(frontier[pick])
+            degree = indptr[u + 1] - indptr[u]
+            if degree == 0:
+                # O peso deste membro zera na próxima renormalização
+                continue
+
+            v = int(indices[indptr[u] + int(uniform * degree)])
+
+            edge_key = (u << 32) | v if u < v else (v << 32) | u
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edges_list.append((u, v))
+
+            if not visited[v]:
+                visited[v] = 1
+                nodes_order.append(v)
+                n_sampled += 1
+                progressed = True
+                _advance_checkpoints()
+
+            frontier[pick] = v
+
+        if progressed:
+            stale_steps = 0
+        else:
+            stale_steps += batch_size
+
+    # Materializa os grafos dos checkpoints a partir dos prefixos das listas
+    checkpoint_graphs = []
+    for cut in checkpoint_cuts:
+        if cut is None:
+            cut = (n_sampled, len(edges_list))
+        n_i, m_i = cut
+        g = nx.Graph()
+        g.add_nodes_from(nodes_order[:n_i])
+        g.add_edges_from(edges_list[:m_i])
+        checkpoint_graphs.append(g)
 
     return checkpoint_graphs
 
@@ -121,80 +797,198 @@ def IRWEB(G, n):
     Retorna:
         networkx.Graph: subgrafo induzido a partir dos nós visitados
     """
-    # Sempre trabalhe com uma cópia para evitar modificar o grafo original
-    G = nx.convert_node_labels_to_integers(G.copy(), 0, 'default', True)
+    # _as_int_graph só relabela quando necessário; o grafo é apenas lido
+    # para montar o CSR e nunca é modificado
+    G = _as_int_graph(G)
     sampled_graph = nx.Graph()
 
-    nodes = list(G.nodes())
-    if not nodes:
+    indptr, indices, _ = _to_csr(G)
+    num_nodes = len(indptr) - 1
+    if num_nodes == 0:
         return sampled_graph
 
-    current_node = random.choice(nodes)
-    stack = [current_node]
-    visited = set() # Conjunto de NÓS visitados pela caminhada (para contar até 'n')
-    walk_edges_visited = set() # Conjunto de ARESTAS percorridas pela caminhada (para evitar revisitações)
+    # Slot da aresta reversa de cada slot, para marcar as duas direções
+    twin = _csr_twin(indptr, indices)
+    # Bitmap de ARESTAS (slots dirigidos) já percorridas pela caminhada —
+    # substitui o conjunto de tuplas (u, v)/(v, u): leitura indexada em vez
+    # de hashing, 1 byte por slot
+    used = np.zeros(len(indices), dtype=np.uint8)
+
+    # Amostra acumulada em listas append-only + bitmap de pertencimento;
+    # o networkx.Graph é montado uma única vez no retorno
+    in_sample = np.zeros(num_nodes, dtype=bool)
+    sampled_nodes = []
+    induced_edges = []
+    # Máscara transitória da vizinhança fechada do nó sendo induzido
+    frontier_mask = np.zeros(num_nodes, dtype=bool)
+
+    current_node = random.randrange(num_nodes)
+    # Pilha pré-alocada: só nós recém-visitados são empilhados, então a
+    # profundidade nunca passa de min(n, num_nodes)
+    stack = np.empty(max(1, min(n, num_nodes)), dtype=np.int32)
+    stack[0] = current_node
+    sp = 1
+    # Bitmap de NÓS visitados pela caminhada + contador (para contar até
+    # 'n') — leitura indexada de 1 byte no lugar do probe de set
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    n_visited = 0
     
     # --- INDUÇÃO LOCAL INICIAL OTIMIZADA ---
-    # Adiciona o nó inicial e todos os seus vizinhos imediatos (e arestas entre eles)
-    nodes_in_neighborhood = {current_node}
-    nodes_in_neighborhood.update(G.neighbors(current_node))
-
-    # Obtém a "view" do subgrafo induzido para esses nós
-    initial_induced_subgraph_view = G.subgraph(nodes_in_neighborhood)
-    # Adiciona os nós e arestas dessa "view" ao grafo amostrado
-    sampled_graph.add_nodes_from(initial_induced_subgraph_view.nodes())
-    sampled_graph.add_edges_from(initial_induced_subgraph_view.edges())
-    
+    # Adiciona o nó inicial e todos os seus vizinhos imediatos (e arestas
+    # entre eles): marca a vizinhança fechada na máscara e varre a linha
+    # CSR de cada vizinho filtrando pela máscara — uma passada NumPy por
+    # vizinho, sem montar subgrafo do NetworkX
+    row = indices[indptr[current_node]:indptr[current_node + 1]]
+    frontier_mask[row] = True
+    frontier_mask[current_node] = True
+    if not in_sample[current_node]:
+        in_sample[current_node] = True
+        sampled_nodes.append(current_node)
+    new_nodes = row[~in_sample[row]]
+    in_sample[new_nodes] = True
+    sampled_nodes.extend(new_nodes.tolist())
+    # Varredura única da vizinhança fechada: o filtro w >= x emite cada
+    # aresta induzida exatamente uma vez (incluindo laços, w == x, e as
+    # incidentes ao próprio current_node), metade dos appends da versão
+    # bidirecional
+    for x in row.tolist() + [current_node]:
+        peers = indices[indptr[x]:indptr[x + 1]]
+        keep = peers[frontier_mask[peers] & (peers >= x)]
+        induced_edges.extend((x, w) for w in keep.tolist())
+    frontier_mask[row] = False
+    frontier_mask[current_node] = False
+
     # Marca o nó inicial como visitado pela caminhada
-    visited.add(current_node)
-
-    while len(visited) < n and stack:
-        # Encontra vizinhos disponíveis que ainda não foram "percorridos" a partir de current_node
-        neighbors = list(G.neighbors(current_node))
-        available_next_nodes = []
-        for neighbor in neighbors:
-            # Verifica se a aresta (current_node, neighbor) não foi usada na caminhada
-            # Como grafos são não direcionados, verifica ambas as direções da tupla da aresta
-            if (current_node, neighbor) not in walk_edges_visited and \
-               (neighbor, current_node) not in walk_edges_visited:
-                available_next_nodes.append(neighbor)
-
-        if available_next_nodes:
-            next_node = random.choice(available_next_nodes)
-            
+    visited[current_node] = 1
+    n_visited = 1
+
+    # Ligação local: poupa um LOAD_GLOBAL + LOAD_ATTR por sorteio no laço
+    _random = random.random
+
+    while n_visited < n and sp > 0:
+        # Sorteia um slot de aresta ainda não "percorrido" a partir de
+        # current_node em passada única (reservoir de tamanho 1) — sem
+        # materializar uma lista de candidatos
+        start = indptr[current_node]
+        end = indptr[current_node + 1]
+        chosen_slot = -1
+        count = 0
+        for j in range(start, end):
+            if not used[j]:
+                count += 1
+                if _random() * count < 1.0:
+                    chosen_slot = j
+
+        if chosen_slot >= 0:
+            j = chosen_slot
+            next_node = int(indices[j])
+
             # Marca a aresta como "percorrida" para futuras verificações
-            # IMPORTANTE: Adiciona ao walk_edges_visited, NÃO ao visited
-            walk_edges_visited.add((current_node, next_node))
-            walk_edges_visited.add((next_node, current_node)) # Para grafos não direcionados
+            # IMPORTANTE: marca o slot e seu gêmeo, NÃO o conjunto visited
+            used[j] = 1
+            used[twin[j]] = 1 # Para grafos não direcionados
 
             # Se o próximo nó ainda não foi visitado pela caminhada principal
-            if next_node not in visited:
-                visited.add(next_node) # Adiciona o NÓ ao conjunto de nós visitados
-                stack.append(next_node)
+            if not visited[next_node]:
+                visited[next_node] = 1 # Marca o NÓ como visitado
+                n_visited += 1
+                stack[sp] = next_node
+                sp += 1
                 current_node = next_node
 
                 # --- INDUÇÃO LOCAL OTIMIZADA PARA O NÓ RECÉM-VISITADO ---
-                # Adiciona o current_node e todos os seus vizinhos imediatos (e arestas entre eles)
-                nodes_in_neighborhood = {current_node}
-                nodes_in_neighborhood.update(G.neighbors(current_node))
-
-                # Obtém a "view" do subgrafo induzido e adiciona ao sampled_graph
-                induced_subgraph_view = G.subgraph(nodes_in_neighborhood)
-                sampled_graph.add_nodes_from(induced_subgraph_view.nodes())
-                sampled_graph.add_edges_from(induced_subgraph_view.edges())
+                # Adiciona o current_node e todos os seus vizinhos imediatos
+                # (e arestas entre eles), com as mesmas passadas NumPy da
+                # indução inicial
+                row = indices[indptr[current_node]:
+                              indptr[current_node + 1]]
+                frontier_mask[row] = True
+                frontier_mask[current_node] = True
+                if not in_sample[current_node]:
+                    in_sample[current_node] = True
+                    sampled_nodes.append(current_node)
+                new_nodes = row[~in_sample[row]]
+                in_sample[new_nodes] = True
+                sampled_nodes.extend(new_nodes.tolist())
+                # Mesma varredura fundida da indução inicial: uma
+                # emissão por aresta induzida (filtro w >= x)
+                for x in row.tolist() + [current_node]:
+                    peers = indices[indptr[x]:indptr[x + 1]]
+                    keep = peers[frontier_mask[peers] & (peers >= x)]
+                    induced_edges.extend((x, w) for w in keep.tolist())
+                frontier_mask[row] = False
+                frontier_mask[current_node] = False
             else:
                 # Se o next_node já foi visitado pela caminhada, apenas move para ele
                 # e não o conta novamente para 'n' nem adiciona seus vizinhos novamente
                 current_node = next_node
         else:
             # Backtrack se não houver arestas disponíveis do current_node
-            stack.pop()
-            if stack:
-                current_node = stack[-1]
-            # else: stack está vazia, não pode mais fazer backtracking
+            sp -= 1
+            if sp > 0:
+                current_node = int(stack[sp - 1])
+            # else: pilha vazia, não pode mais fazer backtracking
 
+    # Monta o grafo amostrado de uma só vez; arestas reemitidas em visitas
+    # de nós vizinhos são deduplicadas pelo próprio nx.Graph
+    sampled_graph.add_nodes_from(sampled_nodes)
+    sampled_graph.add_edges_from(induced_edges)
     return sampled_graph
 
+@functools.lru_cache(maxsize=None)
+def _sb_expand_kernel(k):
+    """
+    Gera (via exec) a expansão de um nó do SB especializada para um valor
+    fixo de k: o limite de vizinhos aceitos vira uma constante no bytecode,
+    eliminando a carga e a comparação da variável k a cada aceite. Na
+    prática o SB é chamado com poucos valores de k, então cada versão é
+    compilada uma única vez e reutilizada (lru_cache).
+
+    A função gerada devolve o n_sampled e a cauda da fila atualizados e
+    um snapshot
+    (n_sampled, n_arestas) por vizinho aceito cuja verificação de
+    checkpoint deve rodar — o aceite que estoura k não gera snapshot,
+    reproduzindo a ordem break-antes-do-checkpoint do laço original.
+    """
+    source = f"""
+def _expand(nbrs, current_node, visited, nodes_order, edges_list,
+            seen_edges, queue, q_tail, n_sampled, max_n, randrange):
+    degree = len(nbrs)
+    accepted = 0
+    snapshots = []
+    for i in range(degree):
+        swap_j = i + randrange(degree - i)
+        nbrs[i], nbrs[swap_j] = nbrs[swap_j], nbrs[i]
+        neighbor = int(nbrs[i])
+        if not visited[neighbor]:
+            if n_sampled >= max_n:
+                break
+            visited[neighbor] = 1
+            nodes_order.append(neighbor)
+            n_sampled += 1
+            edge_key = (current_node << 32) | neighbor \\
+                if current_node < neighbor else (neighbor << 32) | current_node
+            seen_edges.add(edge_key)
+            edges_list.append((current_node, neighbor))
+            queue[q_tail] = neighbor
+            q_tail += 1
+            accepted += 1
+            if accepted >= {k}:
+                break
+            snapshots.append((n_sampled, len(edges_list)))
+        else:
+            edge_key = (current_node << 32) | neighbor \\
+                if current_node < neighbor else (neighbor << 32) | current_node
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edges_list.append((current_node, neighbor))
+    return n_sampled, q_tail, snapshots
+"""
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_expand']
+
+
 def SB(G, max_n, checkpoint_sizes, k):
     """
     Snowball Sampling baseado em BFS com limite de k vizinhos por nó e checkpoints.
@@ -218,77 +1012,108 @@ def SB(G, max_n, checkpoint_sizes, k):
               no momento em que seu número de nós atingiu um checkpoint.
               A ordem dos grafos na lista corresponde à ordem de checkpoint_sizes.
     """
-    G_copy = nx.convert_node_labels_to_integers(G.copy(), 0, 'default', True)
-    sampled_graph = nx.Graph()
+    G_copy = _as_int_graph(G)
 
-    nodes = list(G_copy.nodes())
-    if not nodes:
-        return [sampled_graph] * len(checkpoint_sizes)
+    indptr, indices, _ = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
+    if num_nodes == 0:
+        return [nx.Graph()] * len(checkpoint_sizes)
 
-    visited = set()
-    queue = deque()
+    # Bitmap de nós já amostrados — uma leitura indexada por verificação,
+    # no lugar do probe de dicionário do set/has_node
+    visited = np.zeros(num_nodes, dtype=np.uint8)
+    # Fila BFS pré-alocada com ponteiros de cabeça/cauda: só nós recém-
+    # amostrados entram, então min(max_n, num_nodes) posições bastam —
+    # nenhuma realocação nem objeto Python por entrada
+    queue = np.empty(max(1, min(max_n, num_nodes)), dtype=np.int32)
+    q_head = 0
+    q_tail = 0
 
-    checkpoint_graphs = [None] * len(checkpoint_sizes)
+    # Amostra acumulada em listas append-only; cada checkpoint guarda apenas
+    # um corte (n_nós, n_arestas) e os grafos são materializados no final,
+    # evitando um sampled_graph.copy() O(V+E) por checkpoint
+    nodes_order = []
+    edges_list = []
+    # Deduplicação de arestas por chave (min << 32) | max — um único int64
+    # para hashear, em vez de uma tupla de dois ints
+    seen_edges = set()
+
+    checkpoint_cuts = [None] * len(checkpoint_sizes)
     current_checkpoint_idx = 0
-    
-    checkpoint_sizes.sort()
 
-    start_node = random.choice(nodes)
-    
-    visited.add(start_node)
-    sampled_graph.add_node(start_node)
-    queue.append(start_node)
+    # Os checkpoints devem chegar em ordem crescente (contrato da docstring)
+    cps = _check_checkpoints(checkpoint_sizes)
+
+    start_node = random.randrange(num_nodes)
+
+    visited[start_node] = 1
+    nodes_order.append(start_node)
+    queue[q_tail] = start_node
+    q_tail += 1
+    # Contador local de nós amostrados — evita um len() por iteração
+    n_sampled = 1
 
     while current_checkpoint_idx < len(checkpoint_sizes) and \
-          sampled_graph.number_of_nodes() >= checkpoint_sizes[current_checkpoint_idx]:
-        
-        checkpoint_graphs[current_checkpoint_idx] = sampled_graph.copy()
+          n_sampled >= cps[current_checkpoint_idx]:
+
+        checkpoint_cuts[current_checkpoint_idx] = (n_sampled,
+                                                  len(edges_list))
         current_checkpoint_idx += 1
 
-    while queue and sampled_graph.number_of_nodes() < max_n:
-        current_node = queue.popleft()
-        
-        neighbors = list(G_copy.neighbors(current_node))
-        random.shuffle(neighbors)
-
-        neighbors_to_explore_count = 0 
-        for neighbor in neighbors:
-            # Verifica se o vizinho ainda não foi adicionado ao sampled_graph
-            if neighbor not in visited:
-                # Se o limite de nós para a amostra já foi atingido, para
-                if sampled_graph.number_of_nodes() >= max_n:
-                    break
-
-                visited.add(neighbor)
-                sampled_graph.add_node(neighbor)
-                sampled_graph.add_edge(current_node, neighbor)
-                queue.append(neighbor)
-                neighbors_to_explore_count += 1
-
-                # Verifica se o limite de 'k' vizinhos para o current_node foi atingido
-                # Este é o uso correto do parâmetro 'k' do seu SB original
-                if neighbors_to_explore_count >= k:
-                    break
-
-                # --- VERIFICAÇÃO DE CHECKPOINTS ---
-                while current_checkpoint_idx < len(checkpoint_sizes) and \
-                      sampled_graph.number_of_nodes() >= checkpoint_sizes[current_checkpoint_idx]:
-                    
-                    checkpoint_graphs[current_checkpoint_idx] = sampled_graph.copy()
-                    current_checkpoint_idx += 1
-            elif sampled_graph.has_node(neighbor):
-                if not sampled_graph.has_edge(current_node, neighbor):
-                    sampled_graph.add_edge(current_node, neighbor)
-
-    for i in range(len(checkpoint_sizes)):
-        if checkpoint_graphs[i] is None:
-            if sampled_graph.number_of_nodes() > 0:
-                checkpoint_graphs[i] = sampled_graph.copy()
-            else:
-                checkpoint_graphs[i] = nx.Graph()
+    # Expansão especializada para este k (gerada uma vez e cacheada)
+    expand = _sb_expand_kernel(k)
+    # Ligação local do gerador — o kernel a recebe como argumento e evita
+    # resolver random.randrange a cada vizinho
+    _randrange = random.randrange
+
+    # Buffer de rascunho dimensionado pelo maior grau e reutilizado por
+    # todas as expansões — o embaralhamento in-place do kernel acontece
+    # aqui, sem alocar um array novo por nó da fila
+    max_degree = int(np.diff(indptr).max()) if num_nodes else 0
+    scratch = np.empty(max_degree, dtype=np.int32)
+
+    while q_head < q_tail and n_sampled < max_n:
+        current_node = int(queue[q_head])
+        q_head += 1
+
+        # Fatia CSR copiada para o rascunho; o kernel embaralha por
+        # Fisher-Yates incremental e explora até k vizinhos novos
+        # (ver _sb_expand_kernel)
+        row_start = indptr[current_node]
+        degree = indptr[current_node + 1] - row_start
+        nbrs = scratch[:degree]
+        nbrs[:] = indices[row_start:row_start + degree]
+
+        n_sampled, q_tail, snapshots = expand(nbrs, current_node, visited,
+                                              nodes_order, edges_list,
+                                              seen_edges, queue, q_tail,
+                                              n_sampled, max_n, _randrange)
+
+        # --- VERIFICAÇÃO DE CHECKPOINTS ---
+        # Reproduz os cortes nos mesmos pontos em que o laço original os
+        # registrava, um snapshot por vizinho aceito
+        for snapshot in snapshots:
+            while current_checkpoint_idx < len(checkpoint_sizes) and \
+                  snapshot[0] >= cps[current_checkpoint_idx]:
+
+                checkpoint_cuts[current_checkpoint_idx] = snapshot
+                current_checkpoint_idx += 1
+
+    # Materializa os grafos dos checkpoints reaplicando os prefixos das
+    # listas; checkpoints não atingidos recebem a amostra final
+    checkpoint_graphs = []
+    for cut in checkpoint_cuts:
+        if cut is None:
+            cut = (n_sampled, len(edges_list))
+        n_i, m_i = cut
+        g = nx.Graph()
+        g.add_nodes_from(nodes_order[:n_i])
+        g.add_edges_from(edges_list[:m_i])
+        checkpoint_graphs.append(g)
 
     return checkpoint_graphs
 
+
 def TIES(G, max_n, checkpoint_sizes):
     """
     Total Induction Edge Sampling (TIES) com checkpoints, usando valores absolutos para nós.
@@ -313,61 +1138,162 @@ def TIES(G, max_n, checkpoint_sizes):
               no momento em que o número de nós amostrados atingiu um checkpoint.
               A ordem dos grafos na lista corresponde à ordem de checkpoint_sizes.
     """
-    G_copy = nx.convert_node_labels_to_integers(G.copy(), 0, 'default', True)
-    sampled_nodes = set()
-    edges = list(G_copy.edges()) # Pega uma lista de todas as arestas
-    random.shuffle(edges) # Embaralha para seleção aleatória de arestas
+    G_copy = _as_int_graph(G)
+    indptr, indices, _ = _to_csr(G_copy)
+    num_nodes = len(indptr) - 1
+    # Ordem de inserção dos nós, para reconstruir cada checkpoint por prefixo
+    nodes_order = []
+    # Arestas do subgrafo induzido, acumuladas no momento em que o segundo
+    # extremo entra na amostra — dispensa o rescan de G_copy.subgraph()
+    induced_edges = []
+
+    # Arestas como dois arrays int32 + permutação vetorizada dos índices —
+    # evita materializar e embaralhar uma lista de tuplas Python, O(E)
+    # trocas no interpretador. A lista de arestas sai direto do CSR já
+    # construído (origem repetida pelo grau, destino = indices), filtrando
+    # src <= dst para contar cada aresta não direcionada uma só vez —
+    # laços (src == dst) ocupam um único slot e ficam no pool — sem
+    # passar por G_copy.edges(), que aloca uma tupla Python por aresta
+    if len(indices):
+        src = np.repeat(np.arange(num_nodes, dtype=np.int32),
+                        np.diff(indptr))
+        mask = src <= indices
+        u_arr = src[mask]
+        v_arr = indices[mask]
+        # Aplica a permutação com um único gather vetorizado e materializa
+        # listas de ints nativos — iterar o array NumPy elemento a elemento
+        # encaixotaria um escalar NumPy por aresta dentro do loop
+        order = np.random.permutation(len(u_arr))
+        perm_u = u_arr[order].tolist()
+        perm_v = v_arr[order].tolist()
+    else:
+        perm_u = []
+        perm_v = []
 
-    # Lista para armazenar os grafos induzidos nos checkpoints
-    checkpoint_graphs = [None] * len(checkpoint_sizes)
+    # Bitmap de nós amostrados + contador, no lugar do set com hashing
+    in_sample = np.zeros(num_nodes, dtype=np.uint8)
+
+    # Cada checkpoint guarda apenas o número de nós amostrados no momento em
+    # que foi atingido; os subgrafos induzidos são materializados no final
+    checkpoint_cuts = [None] * len(checkpoint_sizes)
     current_checkpoint_idx = 0
     
-    # Garantir que os checkpoints estão em ordem crescente
-    checkpoint_sizes.sort()
+    # Os checkpoints devem chegar em ordem crescente (contrato da docstring)
+    cps = _check_checkpoints(checkpoint_sizes)
+
+    # Contador local de nós amostrados — evita um len() por aresta sorteada
+    n_sampled = 0
 
     # --- Lógica de Amostragem de Arestas e Checkpoints ---
-    for u, v in edges:
+    # Passada única e em streaming: sorteio da aresta, entrada dos nós na
+    # amostra e indução das arestas acontecem no mesmo laço
+    for u, v in zip(perm_u, perm_v):
         # Se já atingimos o número máximo de nós alvo, paramos de adicionar novos
-        if len(sampled_nodes) >= max_n:
+        if n_sampled >= max_n:
             break
 
-        nodes_before_add = len(sampled_nodes) # Para verificar se novos nós foram adicionados
+        nodes_before_add = n_sampled # Para verificar se novos nós foram adicionados
 
-        # Adiciona os nós da aresta atual à amostra (se ainda não estiverem lá)
+        # Adiciona os nós da aresta atual à amostra (se ainda não estiverem lá),
+        # induzindo na hora as arestas do novo nó com os nós já amostrados
         # Tenta adicionar o primeiro nó
-        if u not in sampled_nodes:
-            sampled_nodes.add(u)
+        if not in_sample[u]:
+            in_sample[u] = 1
+            nodes_order.append(u)
+            n_sampled += 1
+            # Gather vetorizado: mantém da linha de u só os vizinhos que já
+            # estão na amostra, sem testar slot a slot no interpretador
+            row = indices[indptr[u]:indptr[u + 1]]
+            keep = row[in_sample[row] != 0]
+            induced_edges.extend((u, w) for w in keep.tolist())
         # Tenta adicionar o segundo nó, mas verifica se já excedeu max_n com o primeiro
-        if v not in sampled_nodes and len(sampled_nodes) < max_n: # Só adiciona V se não ultrapassar max_n
-            sampled_nodes.add(v)
-        
+        if not in_sample[v] and n_sampled < max_n: # Só adiciona V se não ultrapassar max_n
+            in_sample[v] = 1
+            nodes_order.append(v)
+            n_sampled += 1
+            row = indices[indptr[v]:indptr[v + 1]]
+            keep = row[in_sample[row] != 0]
+            induced_edges.extend((v, w) for w in keep.tolist())
+
         # Se nenhum nó novo foi adicionado por esta aresta, continue para a próxima aresta
-        if len(sampled_nodes) == nodes_before_add:
+        if n_sampled == nodes_before_add:
             continue
 
         # --- VERIFICAÇÃO DE CHECKPOINTS ---
         # Itera por todos os checkpoints que podem ter sido atingidos com a adição dos últimos nós
         while current_checkpoint_idx < len(checkpoint_sizes) and \
-              len(sampled_nodes) >= checkpoint_sizes[current_checkpoint_idx]:
-            
-            # Forma o subgrafo induzido com os nós coletados ATÉ ESTE CHECKPOINT
-            # É FUNDAMENTAL copiar, pois sampled_nodes continuará crescendo
-            current_induced_graph = G_copy.subgraph(sampled_nodes).copy()
-            
-            checkpoint_graphs[current_checkpoint_idx] = current_induced_graph
-            current_checkpoint_idx += 1
+              n_sampled >= cps[current_checkpoint_idx]:
 
-    # --- PREENCHE CHECKPOINTS NÃO ATINGIDOS ---
-    # Se a amostragem terminou antes de atingir todos os checkpoints,
-    # os checkpoints restantes recebem uma cópia do grafo amostrado final
-    for i in range(len(checkpoint_sizes)):
-        if checkpoint_graphs[i] is None:
-            # Se houver nós amostrados até o final da iteração, cria o grafo induzido final.
-            # Caso contrário, retorna um grafo vazio.
-            if sampled_nodes: # Se o conjunto sampled_nodes não estiver vazio
-                final_induced_graph = G_copy.subgraph(sampled_nodes).copy()
-                checkpoint_graphs[i] = final_induced_graph
-            else:
-                checkpoint_graphs[i] = nx.Graph() # Grafo vazio
+            # Registra apenas o corte; o subgrafo induzido é construído depois
+            checkpoint_cuts[current_checkpoint_idx] = (n_sampled,
+                                                       len(induced_edges))
+            current_checkpoint_idx += 1
 
+    # --- MATERIALIZAÇÃO DOS CHECKPOINTS ---
+    # Como induced_edges cresce junto com a amostra, o subgrafo induzido de
+    # cada checkpoint é exatamente um prefixo das duas listas; checkpoints
+    # não atingidos recebem a amostra final
+    checkpoint_graphs = []
+    for cut in checkpoint_cuts:
+        if cut is None:
+            cut = (len(nodes_order), len(induced_edges))
+        n_i, m_i = cut
+        g = nx.Graph()
+        g.add_nodes_from(nodes_order[:n_i])
+        g.add_edges_from(induced_edges[:m_i])
+        checkpoint_graphs.append(g)
     return checkpoint_graphs
+
+
+# Estado por worker preenchido pelo initializer do pool; evita serializar
+# o grafo e os kwargs em cada tarefa
+_run_many_state = None
+
+
+def _run_many_init(fn, G, kwargs):
+    """
+    Initializer do pool: recebe (fn, G, kwargs) uma única vez por worker e
+    os guarda em um global do processo filho.
+    """
+    global _run_many_state
+    _run_many_state = (fn, G, kwargs)
+
+
+def _run_many_task(seed):
+    """
+    Executa uma única amostragem em um processo worker, semeando os dois
+    geradores antes — com fork, todos os workers herdariam o mesmo estado
+    do gerador e produziriam amostras idênticas. A tarefa carrega só a
+    semente; fn, G e kwargs chegam pelo initializer.
+    """
+    fn, G, kwargs = _run_many_state
+    random.seed(seed)
+    np.random.seed(seed & 0xFFFFFFFF)
+    return fn(G, **kwargs)
+
+
+def run_many(fn, G, kwargs, n_runs, workers=None):
+    """
+    Executa n_runs amostragens independentes de fn em paralelo.
+
+    Cada execução é independente das demais (o grafo é somente leitura),
+    então o trabalho é distribuído entre processos — em uma máquina com W
+    núcleos o ganho é próximo de W vezes para lotes grandes.
+
+    Parâmetros:
+        fn (callable): um dos amostradores do módulo (RWEB, IRWEB, SB, TIES).
+        G (networkx.Graph): grafo original, passado a cada execução.
+        kwargs (dict): demais argumentos de fn (ex.: max_n, checkpoint_sizes).
+        n_runs (int): número de amostragens independentes.
+        workers (int): número de processos (None = os.cpu_count()).
+
+    Retorna:
+        list: os n_runs resultados de fn, na ordem de submissão.
+    """
+    seeds = [random.randrange(2**31 - 1) for _ in range(n_runs)]
+    # O grafo é enviado uma vez por worker (initializer), não uma vez por
+    # tarefa — em lotes grandes o custo de pickle do grafo dominaria
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_run_many_init,
+                             initargs=(fn, G, kwargs)) as executor:
+        return list(executor.map(_run_many_task, seeds))